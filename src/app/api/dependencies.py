@@ -9,6 +9,7 @@ from ..core.exceptions.http_exceptions import ForbiddenException, RateLimitExcep
 from ..core.logger import logging
 from ..core.security import TokenType, oauth2_scheme, verify_token
 from ..core.utils.rate_limit import rate_limiter
+from ..crud.category import CategoryExistsLoader
 from ..crud.crud_rate_limit import crud_rate_limits
 from ..crud.crud_tier import crud_tiers
 from ..crud.crud_users import crud_users
@@ -65,6 +66,13 @@ async def get_optional_user(request: Request, db: AsyncSession = Depends(async_g
         return None
 
 
+async def get_category_exists_loader(
+    db: Annotated[AsyncSession, Depends(async_get_db)],
+) -> CategoryExistsLoader:
+    """Provide a per-request loader that batches and memoizes category existence checks"""
+    return CategoryExistsLoader(db)
+
+
 async def get_current_superuser(current_user: Annotated[dict, Depends(get_current_user)]) -> dict:
     if not current_user["is_superuser"]:
         raise ForbiddenException("You do not have enough privileges.")
@@ -1,16 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from ....schemas.blog.blog_schemas import (
     BlogRead,
+    BlogSummaryRead,
     BlogCreate,
     BlogListResponse,
     BlogUpdate,
 )
 from typing import Annotated, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from ....core.db.database import async_get_db
+from ....core.db.database import async_get_db, async_get_read_db
+from ....core.utils.cache import cache, invalidate_pattern
+from ....core.utils.etag import make_etag
+from ....core.utils.pagination import decode_cursor, encode_cursor
 from ....services.blog.crud_blog_service import blog_service
 from ....models.user import User
-from ....api.dependencies import  get_current_user
+from ....core.auth import get_current_user
 import math
 
 router = APIRouter(prefix="/blogs", tags=["blogs"])
@@ -23,49 +29,117 @@ async def create_blog(
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> BlogRead:
     """Create Blog"""
-    exitsting_blog = await blog_service.get_by_name(db, input.title)
-    if exitsting_blog:
+    blog = await blog_service.create(db, input, current_user)
+    if blog is None:
         raise HTTPException(
             status_code=400, detail="Blog with this name already exists"
         )
-    blog = await blog_service.create(db, input, current_user)
+    # Cached list pages must not serve stale results missing the new row
+    await invalidate_pattern("blogs:*")
     return BlogRead.model_validate(blog)
 
 
 @router.get("/get/{blog_id}", response_model=BlogRead)
 async def get_blog_by_id(
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     blog_id: int,
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> BlogRead:
     """Get Blog_ID (Requires Authentication)"""
+    # Conditional GET: probe only updated_at and answer 304 before the full row fetch
+    last_modified = await blog_service.get_updated_at(db, blog_id)
+    if last_modified is None:
+        raise HTTPException(status_code=404, detail="Blog not found")
+    etag = make_etag(last_modified, blog_id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
     blog = await blog_service.get(db, id=blog_id)
     if not blog:
         raise HTTPException(status_code=404, detail="Blog not found")
+    response.headers["ETag"] = etag
     return BlogRead.model_validate(blog)
 
 
 @router.get("/get-all", response_model=BlogListResponse)
+@cache(key_prefix="blogs:page_{page}:size_{size}:cursor_{cursor}", resource_id_name="page", expiration=30)
 async def get_all_blogs(
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    request: Request,
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page; replaces page"),
 ) -> BlogListResponse:
     """Get list blog with pagination"""
+    cursor_key = None
+    if cursor is not None:
+        cursor_key = decode_cursor(cursor)
+        if cursor_key is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     skip = (page - 1) * size
-    blogs, total = await blog_service.get_multi_blog(db=db, skip=skip, limit=size)
-    pages = math.ceil(total / size) if total > 0 else 1
+    blogs, total = await blog_service.get_multi_blog(db=db, skip=skip, limit=size, cursor=cursor_key)
 
-    return BlogListResponse(
-        data=[BlogRead.model_validate(cat) for cat in blogs],
+    next_cursor = encode_cursor(blogs[-1].created_at, blogs[-1].id) if len(blogs) == size else None
+    pages = None
+    if total is not None:
+        pages = math.ceil(total / size) if total > 0 else 1
+
+    # Rows come straight from the database, so skip re-validation entirely
+    return BlogListResponse.model_construct(
+        data=[BlogSummaryRead.from_orm_fast(blog) for blog in blogs],
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         pages=pages,
         size=size,
+        next_cursor=next_cursor,
     )
 
+@router.get("/get-all/stream")
+async def stream_all_blogs(
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page; resumes after it"),
+) -> StreamingResponse:
+    """Stream all blogs (full content) without materializing the page in memory
+
+    The paginated get-all serves summaries; this variant is for bulk reads
+    where content bodies (up to 50k chars each) would otherwise mean holding
+    the ORM rows plus the whole JSON buffer at once. Rows are serialized one
+    at a time straight onto the socket.
+    """
+    cursor_key = None
+    if cursor is not None:
+        cursor_key = decode_cursor(cursor)
+        if cursor_key is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    async def generate():
+        yield b'{"data":['
+        first = True
+        async for blog in await blog_service.stream_blogs(db, cursor=cursor_key):
+            row = orjson.dumps(
+                {
+                    "id": blog.id,
+                    "title": blog.title,
+                    "content": blog.content,
+                    "created_by_user_id": blog.created_by_user_id,
+                    "created_at": blog.created_at,
+                    "updated_at": blog.updated_at,
+                }
+            )
+            yield row if first else b"," + row
+            first = False
+        yield b"]}"
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
 @router.put("/update/{blog_id}", response_model=BlogRead)
+@cache("blog_cache", resource_id_name="blog_id", pattern_to_invalidate_extra=["blogs:*"])
 async def update_blog(
+    request: Request,
     db: Annotated[AsyncSession, Depends(async_get_db)],
     blog_id: int,
     input: BlogUpdate,
@@ -81,7 +155,9 @@ async def update_blog(
     return BlogRead.model_validate(update_blog)
 
 @router.put("/delete/{blog_id}", status_code=200)
+@cache("blog_cache", resource_id_name="blog_id", pattern_to_invalidate_extra=["blogs:*"])
 async def delete_blog(
+    request: Request,
     db : Annotated[AsyncSession, Depends(async_get_db)], blog_id : int ,
 ) -> BlogRead :
     """Delete Blog"""
@@ -1,16 +1,23 @@
 import math
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...api.dependencies import get_category_exists_loader
 from ...core.auth import get_current_active_user, get_current_user_optional
-from ...core.db.database import async_get_db
+from ...core.db.database import async_get_db, async_get_read_db
+from ...core.utils.cache import cache, invalidate_pattern
+from ...core.utils.etag import make_etag
+from ...core.utils.pagination import decode_cursor, encode_cursor
 from ...crud.article import article_crud
+from ...crud.category import CategoryExistsLoader
 from ...models.user import User
 from ...schemas.article import (
     ArticleCreate,
     ArticleResponse,
+    ArticleResponseDetail,
     ArticleResponseSimple,
     ArticleUpdate,
     ArticleListResponse,
@@ -19,6 +26,9 @@ from ...schemas.article import (
 
 router = APIRouter(prefix="/articles", tags=["articles"])
 
+# Validate whole result lists in one pydantic-core call instead of per-row model_validate
+_ARTICLE_DETAIL_LIST_ADAPTER = TypeAdapter(list[ArticleResponse])
+
 
 @router.post("/", response_model=ArticleResponseSimple, status_code=201)
 async def create_article(
@@ -28,177 +38,261 @@ async def create_article(
     current_user: Annotated[User, Depends(get_current_active_user)]
 ) -> ArticleResponseSimple:
     """Create new article"""
-    # Verify category exists
-    if not await article_crud.verify_category_exists(db, category_id=article_in.category_id):
+    # Verify category and author in one query instead of two serial round-trips
+    category_ok, author_ok = await article_crud.verify_category_and_author(
+        db, category_id=article_in.category_id, author_id=current_user.id
+    )
+    if not category_ok:
         raise HTTPException(
             status_code=400,
             detail="Category not found or inactive"
         )
-    
-    # Verify author exists
-    if not await article_crud.verify_author_exists(db, author_id=current_user.id):
+
+    if not author_ok:
         raise HTTPException(
             status_code=400,
             detail="Author not found"
         )
-    
+
     article = await article_crud.create(db, obj_in=article_in, author_id=current_user.id)
+    # Cached list pages must not serve stale results missing the new row
+    await invalidate_pattern("articles:*")
+    await invalidate_pattern("articles_detailed:*")
     return ArticleResponseSimple.model_validate(article)
 
 
 @router.get("/", response_model=ArticleListResponse)
+@cache(
+    key_prefix="articles:page_{page}:size_{size}:cursor_{cursor}:cat_{category_id}"
+    ":auth_{author_id}:pub_{is_published}:act_{is_active}",
+    resource_id_name="page",
+    expiration=30,
+)
 async def get_articles(
+    request: Request,
     *,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page; replaces page"),
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
     author_id: Optional[int] = Query(None, description="Filter by author ID"),
     is_published: Optional[bool] = Query(None, description="Filter by published status"),
     is_active: Optional[bool] = Query(None, description="Filter by active status")
 ) -> ArticleListResponse:
     """Get articles with pagination and filters"""
+    cursor_key = None
+    if cursor is not None:
+        cursor_key = decode_cursor(cursor)
+        if cursor_key is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     skip = (page - 1) * size
     articles, total = await article_crud.get_multi(
-        db, 
-        skip=skip, 
-        limit=size, 
+        db,
+        skip=skip,
+        limit=size,
+        cursor=cursor_key,
         category_id=category_id,
         author_id=author_id,
         is_published=is_published,
         is_active=is_active
     )
-    
-    pages = math.ceil(total / size) if total > 0 else 1
-    
-    return ArticleListResponse(
-        articles=[ArticleResponseSimple.model_validate(article) for article in articles],
+
+    next_cursor = encode_cursor(articles[-1].created_at, articles[-1].id) if len(articles) == size else None
+    pages = None
+    if total is not None:
+        pages = math.ceil(total / size) if total > 0 else 1
+
+    # Rows come straight from the database, so skip re-validation entirely
+    return ArticleListResponse.model_construct(
+        articles=[ArticleResponseSimple.from_orm_fast(article) for article in articles],
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         size=size,
-        pages=pages
+        pages=pages,
+        next_cursor=next_cursor
     )
 
 
 @router.get("/detailed", response_model=ArticleDetailListResponse)
+@cache(
+    key_prefix="articles_detailed:page_{page}:size_{size}:cursor_{cursor}:cat_{category_id}"
+    ":auth_{author_id}:pub_{is_published}:act_{is_active}",
+    resource_id_name="page",
+    expiration=30,
+)
 async def get_articles_detailed(
+    request: Request,
     *,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page; replaces page"),
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
     author_id: Optional[int] = Query(None, description="Filter by author ID"),
     is_published: Optional[bool] = Query(None, description="Filter by published status"),
     is_active: Optional[bool] = Query(None, description="Filter by active status")
 ) -> ArticleDetailListResponse:
     """Get articles with relationships included"""
+    cursor_key = None
+    if cursor is not None:
+        cursor_key = decode_cursor(cursor)
+        if cursor_key is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     skip = (page - 1) * size
     articles, total = await article_crud.get_multi_with_relations(
-        db, 
-        skip=skip, 
-        limit=size, 
+        db,
+        skip=skip,
+        limit=size,
+        cursor=cursor_key,
         category_id=category_id,
         author_id=author_id,
         is_published=is_published,
         is_active=is_active
     )
-    
-    pages = math.ceil(total / size) if total > 0 else 1
-    
-    return ArticleDetailListResponse(
-        articles=[ArticleResponse.model_validate(article) for article in articles],
+
+    next_cursor = encode_cursor(articles[-1].created_at, articles[-1].id) if len(articles) == size else None
+    pages = None
+    if total is not None:
+        pages = math.ceil(total / size) if total > 0 else 1
+
+    # Items were validated by the TypeAdapter; skip re-validating the wrapper
+    return ArticleDetailListResponse.model_construct(
+        articles=_ARTICLE_DETAIL_LIST_ADAPTER.validate_python(articles, from_attributes=True),
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         size=size,
-        pages=pages
+        pages=pages,
+        next_cursor=next_cursor
     )
 
 
-@router.get("/{article_id}", response_model=ArticleResponseSimple)
+@router.get("/{article_id}", response_model=ArticleResponseDetail)
 async def get_article(
+    request: Request,
+    response: Response,
     *,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     article_id: int
-) -> ArticleResponseSimple:
+) -> ArticleResponseDetail:
     """Get article by ID"""
+    # Conditional GET: probe only updated_at and answer 304 before the full row fetch
+    last_modified = await article_crud.get_updated_at(db, id=article_id)
+    if last_modified is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Article not found"
+        )
+    etag = make_etag(last_modified, article_id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
     article = await article_crud.get(db, id=article_id)
     if not article:
         raise HTTPException(
             status_code=404,
             detail="Article not found"
         )
-    return ArticleResponseSimple.model_validate(article)
+    response.headers["ETag"] = etag
+    return ArticleResponseDetail.model_validate(article)
 
 
 @router.get("/{article_id}/detailed", response_model=ArticleResponse)
 async def get_article_detailed(
+    request: Request,
+    response: Response,
     *,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     article_id: int
 ) -> ArticleResponse:
     """Get article by ID with relationships"""
+    last_modified = await article_crud.get_updated_at(db, id=article_id)
+    if last_modified is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Article not found"
+        )
+    etag = make_etag(last_modified, article_id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
     article = await article_crud.get_with_relations(db, id=article_id)
     if not article:
         raise HTTPException(
             status_code=404,
             detail="Article not found"
         )
+    response.headers["ETag"] = etag
     return ArticleResponse.model_validate(article)
 
 
 @router.put("/{article_id}", response_model=ArticleResponseSimple)
+@cache(
+    "article_cache",
+    resource_id_name="article_id",
+    pattern_to_invalidate_extra=["articles:*", "articles_detailed:*"],
+)
 async def update_article(
+    request: Request,
     *,
     db: Annotated[AsyncSession, Depends(async_get_db)],
     article_id: int,
     article_in: ArticleUpdate,
-    current_user: Annotated[User, Depends(get_current_active_user)]
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    category_loader: Annotated[CategoryExistsLoader, Depends(get_category_exists_loader)]
 ) -> ArticleResponseSimple:
     """Update article"""
-    article = await article_crud.get(db, id=article_id)
-    if not article:
+    # Verify category exists if being updated; the loader batches and
+    # memoizes these checks within the request
+    if article_in.category_id and not await category_loader.load(article_in.category_id):
+        raise HTTPException(
+            status_code=400,
+            detail="Category not found or inactive"
+        )
+
+    # Existence, ownership and update in a single statement
+    updated_article, result = await article_crud.update_by_id(
+        db,
+        id=article_id,
+        obj_in=article_in,
+        requester_id=current_user.id,
+        is_superuser=current_user.is_superuser
+    )
+    if result == "not_found":
         raise HTTPException(
             status_code=404,
             detail="Article not found"
         )
-    
-    # Verify ownership (only author or superuser can update)
-    if article.author_id != current_user.id and not current_user.is_superuser:
+    if result == "forbidden":
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    
-    # Verify category exists if being updated
-    if article_in.category_id and not await article_crud.verify_category_exists(db, category_id=article_in.category_id):
-        raise HTTPException(
-            status_code=400,
-            detail="Category not found or inactive"
-        )
-    
-    updated_article = await article_crud.update(db, db_obj=article, obj_in=article_in)
+
     return ArticleResponseSimple.model_validate(updated_article)
 
 
 @router.delete("/{article_id}", status_code=204)
+@cache(
+    "article_cache",
+    resource_id_name="article_id",
+    pattern_to_invalidate_extra=["articles:*", "articles_detailed:*"],
+)
 async def delete_article(
+    request: Request,
     *,
     db: Annotated[AsyncSession, Depends(async_get_db)],
     article_id: int,
     current_user: Annotated[User, Depends(get_current_active_user)]
 ) -> None:
     """Delete article"""
-    article = await article_crud.get(db, id=article_id)
-    if not article:
+    # Existence, ownership and delete in a single statement
+    result = await article_crud.delete_if_owned(
+        db, id=article_id, user_id=current_user.id, is_superuser=current_user.is_superuser
+    )
+    if result == "not_found":
         raise HTTPException(
             status_code=404,
             detail="Article not found"
         )
-    
-    # Verify ownership (only author or superuser can delete)
-    if article.author_id != current_user.id and not current_user.is_superuser:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
-    success = await article_crud.delete(db, id=article_id)
-    if not success:
-        raise HTTPException(
-            status_code=404,
-            detail="Article not found"
-        )
\ No newline at end of file
+    if result == "forbidden":
+        raise HTTPException(status_code=403, detail="Not enough permissions")
\ No newline at end of file
@@ -1,10 +1,13 @@
 import math
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import async_get_db
+from ...core.db.database import async_get_db, async_get_read_db
+from ...core.utils.cache import cache, invalidate_pattern
+from ...core.utils.etag import make_etag
+from ...core.utils.pagination import decode_cursor, encode_cursor
 from ...crud.category import category_crud
 from ...schemas.category import (
     CategoryCreate,
@@ -23,61 +26,94 @@ async def create_category(
     category_in: CategoryCreate
 ) -> CategoryResponse:
     """Create new category"""
-    # Check if category name already exists
-    existing_category = await category_crud.get_by_name(db, name=category_in.name)
-    if existing_category:
+    category = await category_crud.create(db, obj_in=category_in)
+    if category is None:
         raise HTTPException(
             status_code=400,
             detail="Category with this name already exists"
         )
-    
-    category = await category_crud.create(db, obj_in=category_in)
+    # Cached list pages must not serve stale results missing the new row
+    await invalidate_pattern("categories:*")
     return CategoryResponse.model_validate(category)
 
 
 @router.get("/", response_model=CategoryListResponse)
+@cache(
+    key_prefix="categories:page_{page}:size_{size}:cursor_{cursor}:act_{is_active}",
+    resource_id_name="page",
+    expiration=30,
+)
 async def get_categories(
+    request: Request,
     *,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page; replaces page"),
     is_active: Optional[bool] = Query(None, description="Filter by active status")
 ) -> CategoryListResponse:
     """Get categories with pagination"""
+    cursor_key = None
+    if cursor is not None:
+        cursor_key = decode_cursor(cursor)
+        if cursor_key is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     skip = (page - 1) * size
     categories, total = await category_crud.get_multi(
-        db, skip=skip, limit=size, is_active=is_active
+        db, skip=skip, limit=size, cursor=cursor_key, is_active=is_active
     )
-    
-    pages = math.ceil(total / size) if total > 0 else 1
-    
-    return CategoryListResponse(
-        categories=[CategoryResponse.model_validate(cat) for cat in categories],
+
+    next_cursor = encode_cursor(categories[-1].created_at, categories[-1].id) if len(categories) == size else None
+    pages = None
+    if total is not None:
+        pages = math.ceil(total / size) if total > 0 else 1
+
+    # Rows come straight from the database, so skip re-validation entirely
+    return CategoryListResponse.model_construct(
+        categories=[CategoryResponse.from_orm_fast(category) for category in categories],
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         size=size,
-        pages=pages
+        pages=pages,
+        next_cursor=next_cursor
     )
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
 async def get_category(
+    request: Request,
+    response: Response,
     *,
-    db: Annotated[AsyncSession, Depends(async_get_db)],
+    db: Annotated[AsyncSession, Depends(async_get_read_db)],
     category_id: int
 ) -> CategoryResponse:
     """Get category by ID"""
+    # Conditional GET: probe only updated_at and answer 304 before the full row fetch
+    last_modified = await category_crud.get_updated_at(db, id=category_id)
+    if last_modified is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Category not found"
+        )
+    etag = make_etag(last_modified, category_id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
     category = await category_crud.get(db, id=category_id)
     if not category:
         raise HTTPException(
             status_code=404,
             detail="Category not found"
         )
+    response.headers["ETag"] = etag
     return CategoryResponse.model_validate(category)
 
 
 @router.put("/{category_id}", response_model=CategoryResponse)
+@cache("category_cache", resource_id_name="category_id", pattern_to_invalidate_extra=["categories:*"])
 async def update_category(
+    request: Request,
     *,
     db: Annotated[AsyncSession, Depends(async_get_db)],
     category_id: int,
@@ -105,7 +141,9 @@ async def update_category(
 
 
 @router.delete("/{category_id}", status_code=204)
+@cache("category_cache", resource_id_name="category_id", pattern_to_invalidate_extra=["categories:*"])
 async def delete_category(
+    request: Request,
     *,
     db: Annotated[AsyncSession, Depends(async_get_db)],
     category_id: int
@@ -120,7 +158,9 @@ async def delete_category(
 
 
 @router.patch("/{category_id}/deactivate", response_model=CategoryResponse)
+@cache("category_cache", resource_id_name="category_id", pattern_to_invalidate_extra=["categories:*"])
 async def deactivate_category(
+    request: Request,
     *,
     db: Annotated[AsyncSession, Depends(async_get_db)],
     category_id: int
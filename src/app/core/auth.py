@@ -1,72 +1,130 @@
-from typing import Annotated
+import json
+import uuid as uuid_pkg
+from datetime import datetime
+from typing import Annotated, Any, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.db.database import async_get_db
 from ..core.security import verify_token, TokenType
+from ..core.utils import cache
 from ..crud.crud_users import crud_users
 from ..models.user import User
 
-security = HTTPBearer()
+# auto_error=False: missing credentials come through as None instead of an
+# immediate 403, which lets the optional dependency short-circuit for
+# anonymous requests without any token or DB work
+security = HTTPBearer(auto_error=False)
+
+# How long a username/email -> user lookup stays valid in Redis
+USER_LOOKUP_CACHE_TTL = 60
+
+_USER_DATETIME_FIELDS = ("created_at", "updated_at", "deleted_at", "last_online_at")
+
+# The token path never checks the password hash, so cached users carry this
+# sentinel instead of spreading real hashes into the cache tier; any
+# accidental verify against it fails closed
+_HASH_SENTINEL = "<cached>"
+
+
+def _user_from_dict(data: dict[str, Any]) -> User:
+    """Rebuild a User instance from a plain dict (DB row or cached JSON)"""
+    data = dict(data)
+    for field in _USER_DATETIME_FIELDS:
+        value = data.get(field)
+        if isinstance(value, str):
+            data[field] = datetime.fromisoformat(value)
+    if isinstance(data.get("uuid"), str):
+        data["uuid"] = uuid_pkg.UUID(data["uuid"])
+
+    user = User(
+        name=data["name"],
+        username=data["username"],
+        email=data["email"],
+        hashed_password=data.get("hashed_password", _HASH_SENTINEL),
+        profile_image_url=data.get("profile_image_url", ""),
+        uuid=data["uuid"],
+        created_at=data["created_at"],
+        updated_at=data.get("updated_at"),
+        deleted_at=data.get("deleted_at"),
+        is_deleted=data.get("is_deleted", False),
+        is_superuser=data.get("is_superuser", False),
+        is_online=data.get("is_online", False),
+        last_online_at=data.get("last_online_at"),
+    )
+    # id and tier_id are init=False on the mapped dataclass
+    user.id = data["id"]
+    user.tier_id = data.get("tier_id")
+    return user
+
+
+async def _get_user_cached(db: AsyncSession, identifier: str) -> Optional[User]:
+    """Look up a user by username or email, with a short-TTL Redis cache in front of the SELECT"""
+    cache_key = f"user_lookup:{identifier}"
+    if cache.client is not None:
+        cached = await cache.client.get(cache_key)
+        if cached is not None:
+            return _user_from_dict(json.loads(cached))
+
+    user = await crud_users.get_by_identifier(db, identifier)
+
+    if user is not None and cache.client is not None:
+        # Only column values — touching relationships here would lazy-load.
+        # The password hash stays out of Redis; the rebuilt User gets a sentinel
+        payload = {
+            column.key: getattr(user, column.key)
+            for column in User.__table__.columns
+            if column.key != "hashed_password"
+        }
+        await cache.client.set(cache_key, json.dumps(jsonable_encoder(payload)), ex=USER_LOOKUP_CACHE_TTL)
+
+    return user
 
 
 async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    request: Request,
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
     db: Annotated[AsyncSession, Depends(async_get_db)]
 ) -> User:
     """Get current authenticated user from JWT token"""
+    # Several dependencies resolve through here in one request; do the token
+    # and user work once and memoize the result on request.state
+    memoized = getattr(request.state, "current_user", None)
+    if memoized is not None:
+        return memoized
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
+    if credentials is None:
+        raise credentials_exception
+
     try:
         # Verify token
         token_data = await verify_token(
-            token=credentials.credentials, 
-            expected_token_type=TokenType.ACCESS, 
+            token=credentials.credentials,
+            expected_token_type=TokenType.ACCESS,
             db=db
         )
-        
+
         if token_data is None:
             raise credentials_exception
-        
-        # Get user from database
-        if "@" in token_data.username_or_email:
-            user_dict = await crud_users.get(db=db, email=token_data.username_or_email, is_deleted=False)
-        else:
-            user_dict = await crud_users.get(db=db, username=token_data.username_or_email, is_deleted=False)
-        
-        if user_dict is None:
+
+        # Get user from cache or database
+        user = await _get_user_cached(db, token_data.username_or_email)
+
+        if user is None:
             raise credentials_exception
-        
-        # Convert dict to User object if needed
-        if isinstance(user_dict, dict):
-            # Create User object from dict with all required fields
-            user = User(
-                id=user_dict["id"],
-                name=user_dict["name"],
-                username=user_dict["username"],
-                email=user_dict["email"],
-                hashed_password=user_dict["hashed_password"],
-                profile_image_url=user_dict.get("profile_image_url", ""),
-                uuid=user_dict["uuid"],
-                created_at=user_dict["created_at"],
-                updated_at=user_dict.get("updated_at"),
-                deleted_at=user_dict.get("deleted_at"),
-                is_deleted=user_dict.get("is_deleted", False),
-                is_superuser=user_dict.get("is_superuser", False),
-                is_online=user_dict.get("is_online", False),
-                last_online_at=user_dict.get("last_online_at"),
-                tier_id=user_dict.get("tier_id")
-            )
-            return user
-        else:
-            return user_dict
-        
+
+        request.state.current_user = user
+        return user
+
     except Exception:
         raise credentials_exception
 
@@ -75,10 +133,7 @@ async def get_current_active_user(
     current_user: Annotated[User, Depends(get_current_user)]
 ) -> User:
     """Get current active user (not deleted)"""
-    # Handle both dict and User object cases
-    is_deleted = current_user.is_deleted if hasattr(current_user, 'is_deleted') else current_user.get('is_deleted', False)
-    
-    if is_deleted:
+    if current_user.is_deleted:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
@@ -87,10 +142,7 @@ async def get_current_superuser(
     current_user: Annotated[User, Depends(get_current_user)]
 ) -> User:
     """Get current superuser"""
-    # Handle both dict and User object cases
-    is_superuser = current_user.is_superuser if hasattr(current_user, 'is_superuser') else current_user.get('is_superuser', False)
-    
-    if not is_superuser:
+    if not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
@@ -100,14 +152,15 @@ async def get_current_superuser(
 
 # Optional authentication - returns None if no token
 async def get_current_user_optional(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
     db: AsyncSession = Depends(async_get_db)
 ) -> User | None:
     """Get current user if token is provided, None otherwise"""
     if not credentials:
         return None
-    
+
     try:
-        return await get_current_user(credentials, db)
+        return await get_current_user(request, credentials, db)
     except HTTPException:
         return None
\ No newline at end of file
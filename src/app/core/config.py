@@ -33,7 +33,8 @@ class CryptSettings(BaseSettings):
 
 
 class DatabaseSettings(BaseSettings):
-    pass
+    # How long a cached pagination total stays valid (seconds)
+    COUNT_CACHE_TTL: int = config("COUNT_CACHE_TTL", default=30)
 
 
 class SQLiteSettings(DatabaseSettings):
@@ -64,6 +65,11 @@ class PostgresSettings(DatabaseSettings):
     POSTGRES_ASYNC_PREFIX: str = config("POSTGRES_ASYNC_PREFIX", default="postgresql+asyncpg://")
     POSTGRES_URI: str = f"{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_SERVER}:{POSTGRES_PORT}/{POSTGRES_DB}"
     POSTGRES_URL: str | None = config("POSTGRES_URL", default=None)
+    # Optional read replica; defaults to the primary so single-node setups need no extra config
+    POSTGRES_READ_URI: str = config("POSTGRES_READ_URI", default=POSTGRES_URI)
+    POSTGRES_POOL_SIZE: int = config("POSTGRES_POOL_SIZE", default=20)
+    POSTGRES_POOL_MAX_OVERFLOW: int = config("POSTGRES_POOL_MAX_OVERFLOW", default=40)
+    POSTGRES_POOL_RECYCLE: int = config("POSTGRES_POOL_RECYCLE", default=3600)
 
 
 class FirstUserSettings(BaseSettings):
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncGenerator, Callable
 from contextlib import _AsyncGeneratorContextManager, asynccontextmanager
 from typing import Any
@@ -11,6 +12,8 @@ from fastapi import APIRouter, Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 
 from ..api.dependencies import get_current_superuser
 from ..core.utils.rate_limit import rate_limiter
@@ -30,15 +33,63 @@ from .config import (
 )
 from .db.database import Base
 from .db.database import async_engine as engine
+from .db.database import read_engine
+from ..schemas.article import ArticleDetailListResponse, ArticleListResponse, ArticleResponse, ArticleResponseSimple
+from ..schemas.blog.blog_schemas import (
+    BlogCreateInternal,
+    BlogDelete,
+    BlogListResponse,
+    BlogRead,
+    BlogSummaryRead,
+    BlogUpdateInternal,
+)
+from ..schemas.category import CategoryListResponse, CategoryResponse
 from .utils import cache, queue
 
 
 # -------------- database --------------
+# UUIDv7 built from gen_random_uuid(): overlay the first 48 bits with the
+# millisecond unix timestamp and force the version/variant bits, so no
+# extension (pg_uuidv7) is required. The models reference this function as
+# a server_default, so it must exist before create_all emits the tables;
+# migration d52e8a3b61cf installs the same definition for migrated DBs.
+UUID_GENERATE_V7_SQL = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+SELECT encode(
+    set_bit(
+        set_bit(
+            overlay(
+                uuid_send(gen_random_uuid())
+                placing substring(
+                    int8send(floor(extract(epoch from clock_timestamp()) * 1000)::bigint)
+                    from 3
+                )
+                from 1 for 6
+            ),
+            52, 1
+        ),
+        53, 1
+    ),
+    'hex')::uuid;
+$$ LANGUAGE sql VOLATILE;
+"""
+
+
 async def create_tables() -> None:
     async with engine.begin() as conn:
+        await conn.execute(text(UUID_GENERATE_V7_SQL))
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_up_db_pool() -> None:
+    """Open the configured number of pooled connections so the first requests don't pay connect latency."""
+    engines = {engine, read_engine}  # read_engine aliases engine when no replica is configured
+    for eng in engines:
+        connections = await asyncio.gather(*[eng.connect() for _ in range(settings.POSTGRES_POOL_SIZE)])
+        for connection in connections:
+            await connection.close()
+
+
 # -------------- cache --------------
 async def create_redis_cache_pool() -> None:
     cache.pool = redis.ConnectionPool.from_url(settings.REDIS_CACHE_URL)
@@ -71,6 +122,32 @@ async def close_redis_rate_limit_pool() -> None:
 
 
 # -------------- application --------------
+def prebuild_response_schemas() -> None:
+    """Build pydantic core schemas for the hot models before traffic arrives
+
+    Pydantic builds validators lazily on first use, so without this the
+    first request to each endpoint pays the schema-build cost on the hot
+    path. model_rebuild() is a no-op for models that are already complete
+    and finishes the defer_build=True internals, concentrating all build
+    work in startup where readiness probes haven't fired yet.
+    """
+    for model in (
+        BlogRead,
+        BlogSummaryRead,
+        BlogListResponse,
+        BlogCreateInternal,
+        BlogUpdateInternal,
+        BlogDelete,
+        ArticleResponseSimple,
+        ArticleResponse,
+        ArticleListResponse,
+        ArticleDetailListResponse,
+        CategoryResponse,
+        CategoryListResponse,
+    ):
+        model.model_rebuild()
+
+
 async def set_threadpool_tokens(number_of_tokens: int = 100) -> None:
     limiter = anyio.to_thread.current_default_thread_limiter()
     limiter.total_tokens = number_of_tokens
@@ -99,6 +176,7 @@ def lifespan_factory(
         app.state.initialization_complete = initialization_complete
 
         await set_threadpool_tokens()
+        prebuild_response_schemas()
 
         try:
             if isinstance(settings, RedisCacheSettings):
@@ -113,6 +191,9 @@ def lifespan_factory(
             if create_tables_on_start:
                 await create_tables()
 
+            if isinstance(settings, DatabaseSettings):
+                await warm_up_db_pool()
+
             initialization_complete.set()
 
             yield
@@ -205,6 +286,9 @@ def create_application(
     if lifespan is None:
         lifespan = lifespan_factory(settings, create_tables_on_start=create_tables_on_start)
 
+    # orjson serializes datetime/UUID-heavy responses several times faster than stdlib json
+    kwargs.setdefault("default_response_class", ORJSONResponse)
+
     application = FastAPI(lifespan=lifespan, **kwargs)
     application.include_router(router)
 
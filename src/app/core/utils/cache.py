@@ -1,9 +1,9 @@
 import functools
-import json
 import re
 from collections.abc import AsyncGenerator, Callable
 from typing import Any
 
+import orjson
 from fastapi import Request
 from fastapi.encoders import jsonable_encoder
 from redis.asyncio import ConnectionPool, Redis
@@ -183,6 +183,16 @@ async def _delete_keys_by_pattern(pattern: str) -> None:
             break
 
 
+async def invalidate_pattern(pattern: str) -> None:
+    """Invalidate every cached key matching `pattern` (e.g. "blogs:*").
+
+    For write endpoints that cannot use the `cache` decorator's invalidation —
+    creates have no resource id to key the decorator on. No-op when the cache
+    client is not initialized.
+    """
+    await _delete_keys_by_pattern(pattern)
+
+
 def cache(
     key_prefix: str,
     resource_id_name: Any = None,
@@ -304,18 +314,18 @@ def cache(
 
                 cached_data = await client.get(cache_key)
                 if cached_data:
-                    return json.loads(cached_data.decode())
+                    return orjson.loads(cached_data)
 
             result = await func(request, *args, **kwargs)
 
             if request.method == "GET":
                 serializable_data = jsonable_encoder(result)
-                serialized_data = json.dumps(serializable_data)
+                serialized_data = orjson.dumps(serializable_data)
 
                 await client.set(cache_key, serialized_data)
                 await client.expire(cache_key, expiration)
 
-                return json.loads(serialized_data)
+                return orjson.loads(serialized_data)
 
             else:
                 await client.delete(cache_key)
@@ -0,0 +1,6 @@
+from datetime import datetime
+
+
+def make_etag(last_modified: datetime, resource_id: int) -> str:
+    """Build a weak ETag from a row's last-modified time and primary key"""
+    return f'W/"{int(last_modified.timestamp())}-{resource_id}"'
@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Optional
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor string."""
+    return f"{created_at.isoformat()}_{id}"
+
+
+def decode_cursor(cursor: str) -> Optional[tuple[datetime, int]]:
+    """Decode a cursor produced by `encode_cursor`; returns None if malformed."""
+    timestamp_part, separator, id_part = cursor.rpartition("_")
+    if not separator:
+        return None
+
+    try:
+        return datetime.fromisoformat(timestamp_part), int(id_part)
+    except ValueError:
+        return None
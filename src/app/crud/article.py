@@ -1,10 +1,12 @@
-from datetime import UTC, datetime
+import time
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, delete, exists, func, insert, lambda_stmt, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
 
+from ..core.config import settings
 from ..models.article import Article
 from ..models.category import Category
 from ..models.user import User
@@ -13,7 +15,44 @@ from ..schemas.article import ArticleCreate, ArticleUpdate
 
 class ArticleCRUD:
     """CRUD operations for Article model"""
-    
+
+    def __init__(self) -> None:
+        # Pagination totals per filter signature, (total, stored_at); paging
+        # through the same filter set within the TTL skips the count work
+        self._count_cache: dict[tuple, tuple[int, float]] = {}
+
+    def _cached_total(self, key: tuple) -> Optional[int]:
+        entry = self._count_cache.get(key)
+        if entry is not None and time.monotonic() - entry[1] < settings.COUNT_CACHE_TTL:
+            return entry[0]
+        return None
+
+    def _store_total(self, key: tuple, total: int) -> None:
+        self._count_cache[key] = (total, time.monotonic())
+
+    def _invalidate_counts(self) -> None:
+        self._count_cache.clear()
+
+    @staticmethod
+    def _count_stmt(
+        *,
+        category_id: Optional[int] = None,
+        author_id: Optional[int] = None,
+        is_published: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+    ):
+        """COUNT query matching the list filters, for pages past the last row"""
+        stmt = select(func.count()).select_from(Article)
+        if category_id is not None:
+            stmt = stmt.where(Article.category_id == category_id)
+        if author_id is not None:
+            stmt = stmt.where(Article.author_id == author_id)
+        if is_published is not None:
+            stmt = stmt.where(Article.is_published == is_published)
+        if is_active is not None:
+            stmt = stmt.where(Article.is_active == is_active)
+        return stmt
+
     async def create(
         self, 
         db: AsyncSession, 
@@ -21,34 +60,84 @@ class ArticleCRUD:
         obj_in: ArticleCreate, 
         author_id: int
     ) -> Article:
-        """Create new article"""
-        article = Article(
-            title=obj_in.title,
-            content=obj_in.content,
-            summary=obj_in.summary,
-            category_id=obj_in.category_id,
-            author_id=author_id,
-            is_published=obj_in.is_published,
-            is_active=obj_in.is_active
+        """Create new article in a single INSERT..RETURNING round-trip"""
+        stmt = (
+            insert(Article)
+            .values(
+                title=obj_in.title,
+                content=obj_in.content,
+                summary=obj_in.summary,
+                category_id=obj_in.category_id,
+                author_id=author_id,
+                is_published=obj_in.is_published,
+                is_active=obj_in.is_active,
+            )
+            .returning(Article)
         )
-        db.add(article)
+        article = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(article)
+        self._invalidate_counts()
         return article
-    
+
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        items: list[ArticleCreate],
+        author_id: int
+    ) -> list[Article]:
+        """Create many articles in one batched INSERT..RETURNING
+
+        Bulk ingestion (imports, seeds) calling `create` in a loop pays one
+        round-trip per row; here the driver batches the whole payload into a
+        single multi-values INSERT prepared once.
+        """
+        if not items:
+            return []
+
+        payload = [
+            {
+                "title": item.title,
+                "content": item.content,
+                "summary": item.summary,
+                "category_id": item.category_id,
+                "author_id": author_id,
+                "is_published": item.is_published,
+                "is_active": item.is_active,
+            }
+            for item in items
+        ]
+        stmt = insert(Article).returning(Article)
+        articles = (await db.execute(stmt, payload)).scalars().all()
+        await db.commit()
+        self._invalidate_counts()
+        return list(articles)
+
+
     async def get(self, db: AsyncSession, *, id: int) -> Optional[Article]:
         """Get article by ID"""
         stmt = select(Article).where(Article.id == id)
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def get_updated_at(self, db: AsyncSession, *, id: int) -> Optional[datetime]:
+        """Get only the article's last-modified time — a cheap probe for conditional GETs"""
+        stmt = select(func.coalesce(Article.updated_at, Article.created_at)).where(Article.id == id)
+        return await db.scalar(stmt)
+
     async def get_with_relations(self, db: AsyncSession, *, id: int) -> Optional[Article]:
         """Get article by ID with relationships loaded"""
         stmt = (
             select(Article)
             .options(
-                selectinload(Article.category),
-                selectinload(Article.author)
+                # Single-row detail fetch: one joined SELECT beats two extra
+                # selectin queries, and row-width duplication doesn't apply
+                joinedload(Article.category, innerjoin=True),
+                joinedload(Article.author, innerjoin=True).load_only(
+                    User.id, User.name, User.username, User.email
+                ),
+                # Anything not eagerly loaded above must not trigger a lazy SELECT
+                raiseload('*')
             )
             .where(Article.id == id)
         )
@@ -59,98 +148,187 @@ class ArticleCRUD:
         self, 
         db: AsyncSession, 
         *, 
-        skip: int = 0, 
+        skip: int = 0,
         limit: int = 100,
+        cursor: Optional[tuple[datetime, int]] = None,
         category_id: Optional[int] = None,
         author_id: Optional[int] = None,
         is_published: Optional[bool] = None,
         is_active: Optional[bool] = None
-    ) -> tuple[list[Article], int]:
-        """Get multiple articles with pagination and filters"""
-        # Build base query
-        stmt = select(Article)
-        count_stmt = select(func.count(Article.id))
-        
-        # Add filters
-        if category_id is not None:
-            stmt = stmt.where(Article.category_id == category_id)
-            count_stmt = count_stmt.where(Article.category_id == category_id)
-        
-        if author_id is not None:
-            stmt = stmt.where(Article.author_id == author_id)
-            count_stmt = count_stmt.where(Article.author_id == author_id)
-            
-        if is_published is not None:
-            stmt = stmt.where(Article.is_published == is_published)
-            count_stmt = count_stmt.where(Article.is_published == is_published)
-            
-        if is_active is not None:
-            stmt = stmt.where(Article.is_active == is_active)
-            count_stmt = count_stmt.where(Article.is_active == is_active)
-        
+    ) -> tuple[list[Article], Optional[int]]:
+        """Get multiple articles with pagination and filters
+
+        With a keyset `cursor` the page is located by a (created_at, id) WHERE
+        clause instead of OFFSET and the COUNT query is skipped entirely, so
+        deep pages stay O(limit); `total` is None in that mode.
+        """
+        # Build base query as a lambda statement so each filter-shape compiles
+        # its SQL once and later calls only swap bound parameters. Only the
+        # columns ArticleResponseSimple needs are projected — the content body
+        # can be large and list views never show it. Page mode projects the
+        # total as a window column so one query covers rows and count
+        projection = load_only(
+            Article.id,
+            Article.title,
+            Article.summary,
+            Article.category_id,
+            Article.author_id,
+            Article.is_published,
+            Article.is_active,
+            Article.uuid,
+            Article.created_at,
+            Article.updated_at,
+        )
+        cache_key = (category_id, author_id, is_published, is_active)
+        cached_total = self._cached_total(cache_key) if cursor is None else None
+        if cursor is None and cached_total is None:
+            stmt = lambda_stmt(
+                lambda: select(Article, func.count().over().label("total")).options(projection)
+            )
+        else:
+            stmt = lambda_stmt(lambda: select(Article).options(projection))
+
+        # Add filters; the common default listing carries none, so skip the
+        # predicate building entirely and go straight to pagination
+        if cache_key != (None, None, None, None):
+            if category_id is not None:
+                stmt += lambda s: s.where(Article.category_id == category_id)
+
+            if author_id is not None:
+                stmt += lambda s: s.where(Article.author_id == author_id)
+
+            if is_published is not None:
+                stmt += lambda s: s.where(Article.is_published == is_published)
+
+            if is_active is not None:
+                stmt += lambda s: s.where(Article.is_active == is_active)
+
         # Add pagination
-        stmt = stmt.offset(skip).limit(limit).order_by(Article.created_at.desc())
-        
-        # Execute queries
-        result = await db.execute(stmt)
-        count_result = await db.execute(count_stmt)
-        
-        articles = result.scalars().all()
-        total = count_result.scalar()
-        
+        if cursor is not None:
+            # Explicit bindparams: datetimes in a tuple comparison aren't
+            # trackable as plain closure literals by the lambda cache
+            cursor_created_at = bindparam("cursor_created_at", cursor[0])
+            cursor_id = bindparam("cursor_id", cursor[1])
+            stmt += lambda s: s.where(
+                tuple_(Article.created_at, Article.id) < tuple_(cursor_created_at, cursor_id)
+            )
+        else:
+            stmt += lambda s: s.offset(skip)
+        stmt += lambda s: s.limit(limit).order_by(Article.created_at.desc(), Article.id.desc())
+
+        # Execute: one round-trip in every mode
+        if cursor is None and cached_total is None:
+            rows = (await db.execute(stmt)).all()
+            articles = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total
+            else:
+                # Page landed past the last row: the window column vanished
+                # with the rows, so issue the real count rather than caching
+                # a false zero
+                total = await db.scalar(
+                    self._count_stmt(
+                        category_id=category_id,
+                        author_id=author_id,
+                        is_published=is_published,
+                        is_active=is_active,
+                    )
+                )
+            self._store_total(cache_key, total)
+        else:
+            articles = (await db.execute(stmt)).scalars().all()
+            total = cached_total
+
         return articles, total
-    
+
     async def get_multi_with_relations(
         self, 
         db: AsyncSession, 
         *, 
-        skip: int = 0, 
+        skip: int = 0,
         limit: int = 100,
+        cursor: Optional[tuple[datetime, int]] = None,
         category_id: Optional[int] = None,
         author_id: Optional[int] = None,
         is_published: Optional[bool] = None,
         is_active: Optional[bool] = None
-    ) -> tuple[list[Article], int]:
-        """Get multiple articles with relationships loaded"""
-        # Build base query
-        stmt = (
-            select(Article)
-            .options(
-                selectinload(Article.category),
-                selectinload(Article.author)
-            )
+    ) -> tuple[list[Article], Optional[int]]:
+        """Get multiple articles with relationships loaded
+
+        Supports the same keyset `cursor` mode as `get_multi`.
+        """
+        # Build base query as a lambda statement, same as get_multi, so each
+        # filter-shape compiles once. Page mode projects the total as a window
+        # column so one query covers rows and count — unless a total is cached
+        loaders = (
+            # selectin for the list path: joining would repeat every article's
+            # full column set (content included) once per join row, so two tiny
+            # IN-list queries per page are cheaper than the wide result set.
+            # The author load only needs the UserResponse columns — no point
+            # hauling hashed_password and friends for every row
+            selectinload(Article.category),
+            selectinload(Article.author).load_only(
+                User.id, User.name, User.username, User.email
+            ),
+            # Anything not eagerly loaded above must not trigger a lazy SELECT per row
+            raiseload('*'),
         )
-        count_stmt = select(func.count(Article.id))
-        
+        cache_key = (category_id, author_id, is_published, is_active)
+        cached_total = self._cached_total(cache_key) if cursor is None else None
+        if cursor is None and cached_total is None:
+            stmt = lambda_stmt(
+                lambda: select(Article, func.count().over().label("total")).options(*loaders)
+            )
+        else:
+            stmt = lambda_stmt(lambda: select(Article).options(*loaders))
+
         # Add filters
         if category_id is not None:
-            stmt = stmt.where(Article.category_id == category_id)
-            count_stmt = count_stmt.where(Article.category_id == category_id)
-        
+            stmt += lambda s: s.where(Article.category_id == category_id)
+
         if author_id is not None:
-            stmt = stmt.where(Article.author_id == author_id)
-            count_stmt = count_stmt.where(Article.author_id == author_id)
-            
+            stmt += lambda s: s.where(Article.author_id == author_id)
+
         if is_published is not None:
-            stmt = stmt.where(Article.is_published == is_published)
-            count_stmt = count_stmt.where(Article.is_published == is_published)
-            
+            stmt += lambda s: s.where(Article.is_published == is_published)
+
         if is_active is not None:
-            stmt = stmt.where(Article.is_active == is_active)
-            count_stmt = count_stmt.where(Article.is_active == is_active)
-        
+            stmt += lambda s: s.where(Article.is_active == is_active)
+
         # Add pagination
-        stmt = stmt.offset(skip).limit(limit).order_by(Article.created_at.desc())
-        
-        # Execute queries
-        result = await db.execute(stmt)
-        count_result = await db.execute(count_stmt)
-        
-        articles = result.scalars().all()
-        total = count_result.scalar()
-        
+        if cursor is not None:
+            cursor_created_at = bindparam("cursor_created_at", cursor[0])
+            cursor_id = bindparam("cursor_id", cursor[1])
+            stmt += lambda s: s.where(
+                tuple_(Article.created_at, Article.id) < tuple_(cursor_created_at, cursor_id)
+            )
+        else:
+            stmt += lambda s: s.offset(skip)
+        stmt += lambda s: s.limit(limit).order_by(Article.created_at.desc(), Article.id.desc())
+
+        # Execute: one round-trip in every mode
+        if cursor is None and cached_total is None:
+            rows = (await db.execute(stmt)).all()
+            articles = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total
+            else:
+                # See get_multi: an empty page must not cache total=0
+                total = await db.scalar(
+                    self._count_stmt(
+                        category_id=category_id,
+                        author_id=author_id,
+                        is_published=is_published,
+                        is_active=is_active,
+                    )
+                )
+            self._store_total(cache_key, total)
+        else:
+            articles = (await db.execute(stmt)).scalars().all()
+            total = cached_total
+
         return articles, total
-    
+
     async def update(
         self, 
         db: AsyncSession, 
@@ -158,43 +336,124 @@ class ArticleCRUD:
         db_obj: Article, 
         obj_in: ArticleUpdate
     ) -> Article:
-        """Update article"""
+        """Update article in one UPDATE..RETURNING round-trip"""
         update_data = obj_in.model_dump(exclude_unset=True)
-        
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
-        
-        db_obj.updated_at = datetime.now(UTC)
+        if not update_data:
+            return db_obj
+
+        stmt = (
+            update(Article)
+            .where(Article.id == db_obj.id)
+            .values(**update_data)
+            .returning(Article)
+        )
+        article = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+        self._invalidate_counts()
+        return article
     
-    async def delete(self, db: AsyncSession, *, id: int) -> bool:
-        """Delete article"""
-        stmt = select(Article).where(Article.id == id)
-        result = await db.execute(stmt)
-        article = result.scalar_one_or_none()
-        
-        if article:
-            await db.delete(article)
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        *,
+        id: int,
+        obj_in: ArticleUpdate,
+        requester_id: int,
+        is_superuser: bool
+    ) -> tuple[Optional[Article], str]:
+        """Update an article in one UPDATE..RETURNING, ownership check included
+
+        Returns (article, "updated") on success, otherwise (None, "not_found")
+        or (None, "forbidden") — the prior SELECT-then-UPDATE pattern cost an
+        extra round-trip and full row hydration just to read author_id.
+        """
+        update_data = obj_in.model_dump(exclude_unset=True)
+
+        ownership = [Article.id == id]
+        if not is_superuser:
+            ownership.append(Article.author_id == requester_id)
+
+        if update_data:
+            stmt = update(Article).where(*ownership).values(**update_data).returning(Article)
+            article = (await db.execute(stmt)).scalar_one_or_none()
+        else:
+            # Nothing to change; just fetch under the same ownership predicate
+            article = await db.scalar(select(Article).where(*ownership))
+
+        if article is not None:
             await db.commit()
+            self._invalidate_counts()
+            return article, "updated"
+
+        await db.rollback()
+        found = await db.scalar(select(exists().where(Article.id == id)))
+        return None, "forbidden" if found else "not_found"
+
+    async def delete(self, db: AsyncSession, *, id: int) -> bool:
+        """Delete article in a single DELETE..RETURNING round-trip"""
+        stmt = delete(Article).where(Article.id == id).returning(Article.id)
+        deleted_id = (await db.execute(stmt)).scalar_one_or_none()
+        await db.commit()
+        if deleted_id is not None:
+            self._invalidate_counts()
             return True
         return False
     
+    async def delete_if_owned(
+        self,
+        db: AsyncSession,
+        *,
+        id: int,
+        user_id: int,
+        is_superuser: bool
+    ) -> str:
+        """Delete an article only if the user owns it, in a single statement
+
+        Returns "deleted", "not_found" or "forbidden". The ownership check is
+        folded into the DELETE's WHERE clause so the hot path is one
+        round-trip; only a rejected delete pays a second probe to tell
+        404 from 403.
+        """
+        stmt = delete(Article).where(Article.id == id).returning(Article.id)
+        if not is_superuser:
+            stmt = stmt.where(Article.author_id == user_id)
+
+        deleted_id = (await db.execute(stmt)).scalar_one_or_none()
+        if deleted_id is not None:
+            await db.commit()
+            self._invalidate_counts()
+            return "deleted"
+
+        await db.rollback()
+        found = await db.scalar(select(exists().where(Article.id == id)))
+        return "forbidden" if found else "not_found"
+
     async def verify_category_exists(self, db: AsyncSession, *, category_id: int) -> bool:
         """Verify if category exists and is active"""
-        stmt = select(Category).where(
-            Category.id == category_id,
-            Category.is_active == True
+        stmt = select(
+            exists().where(Category.id == category_id, Category.is_active == True)
         )
-        result = await db.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        return bool(await db.scalar(stmt))
     
+    async def verify_category_and_author(
+        self,
+        db: AsyncSession,
+        *,
+        category_id: int,
+        author_id: int
+    ) -> tuple[bool, bool]:
+        """Verify category and author existence in a single round-trip"""
+        stmt = select(
+            exists().where(Category.id == category_id, Category.is_active == True).label("category_ok"),
+            exists().where(User.id == author_id).label("author_ok"),
+        )
+        row = (await db.execute(stmt)).one()
+        return bool(row.category_ok), bool(row.author_ok)
+
     async def verify_author_exists(self, db: AsyncSession, *, author_id: int) -> bool:
         """Verify if author exists"""
-        stmt = select(User).where(User.id == author_id)
-        result = await db.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        stmt = select(exists().where(User.id == author_id))
+        return bool(await db.scalar(stmt))
 
 
 # Create instance
@@ -1,26 +1,53 @@
-from datetime import UTC, datetime
+import asyncio
+import time
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, delete, func, lambda_stmt, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.config import settings
 from ..models.category import Category
 from ..schemas.category import CategoryCreate, CategoryUpdate
 
 
 class CategoryCRUD:
     """CRUD operations for Category model"""
-    
-    async def create(self, db: AsyncSession, *, obj_in: CategoryCreate) -> Category:
-        """Create new category"""
-        category = Category(
-            name=obj_in.name,
-            description=obj_in.description,
-            is_active=obj_in.is_active
+
+    def __init__(self) -> None:
+        # Pagination totals per filter signature, (total, stored_at); paging
+        # through the same filter set within the TTL skips the count work
+        self._count_cache: dict[tuple, tuple[int, float]] = {}
+
+    def _cached_total(self, key: tuple) -> Optional[int]:
+        entry = self._count_cache.get(key)
+        if entry is not None and time.monotonic() - entry[1] < settings.COUNT_CACHE_TTL:
+            return entry[0]
+        return None
+
+    def _store_total(self, key: tuple, total: int) -> None:
+        self._count_cache[key] = (total, time.monotonic())
+
+    def _invalidate_counts(self) -> None:
+        self._count_cache.clear()
+
+    async def create(self, db: AsyncSession, *, obj_in: CategoryCreate) -> Optional[Category]:
+        """Create new category in one INSERT; returns None when the name already exists"""
+        stmt = (
+            pg_insert(Category)
+            .values(
+                name=obj_in.name,
+                description=obj_in.description,
+                is_active=obj_in.is_active,
+            )
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(Category)
         )
-        db.add(category)
+        category = (await db.execute(stmt)).scalar_one_or_none()
         await db.commit()
-        await db.refresh(category)
+        if category is not None:
+            self._invalidate_counts()
         return category
     
     async def get(self, db: AsyncSession, *, id: int) -> Optional[Category]:
@@ -29,6 +56,11 @@ class CategoryCRUD:
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def get_updated_at(self, db: AsyncSession, *, id: int) -> Optional[datetime]:
+        """Get only the category's last-modified time — a cheap probe for conditional GETs"""
+        stmt = select(func.coalesce(Category.updated_at, Category.created_at)).where(Category.id == id)
+        return await db.scalar(stmt)
+
     async def get_by_name(self, db: AsyncSession, *, name: str) -> Optional[Category]:
         """Get category by name"""
         stmt = select(Category).where(Category.name == name)
@@ -39,30 +71,61 @@ class CategoryCRUD:
         self, 
         db: AsyncSession, 
         *, 
-        skip: int = 0, 
+        skip: int = 0,
         limit: int = 100,
+        cursor: Optional[tuple[datetime, int]] = None,
         is_active: Optional[bool] = None
-    ) -> tuple[list[Category], int]:
-        """Get multiple categories with pagination"""
-        # Build base query
-        stmt = select(Category)
-        count_stmt = select(func.count(Category.id))
-        
+    ) -> tuple[list[Category], Optional[int]]:
+        """Get multiple categories with pagination
+
+        With a keyset `cursor` the page is located by a (created_at, id) WHERE
+        clause instead of OFFSET and no COUNT is issued; `total` is None then.
+        """
+        # Build base query as a lambda statement so each filter-shape compiles
+        # once and later calls only swap bound parameters. Page mode projects
+        # the total as a window column so one query covers rows and count —
+        # unless a fresh total is cached
+        cache_key = (is_active,)
+        cached_total = self._cached_total(cache_key) if cursor is None else None
+        if cursor is None and cached_total is None:
+            stmt = lambda_stmt(lambda: select(Category, func.count().over().label("total")))
+        else:
+            stmt = lambda_stmt(lambda: select(Category))
+
         # Add filters
         if is_active is not None:
-            stmt = stmt.where(Category.is_active == is_active)
-            count_stmt = count_stmt.where(Category.is_active == is_active)
-        
+            stmt += lambda s: s.where(Category.is_active == is_active)
+
         # Add pagination
-        stmt = stmt.offset(skip).limit(limit).order_by(Category.created_at.desc())
-        
-        # Execute queries
-        result = await db.execute(stmt)
-        count_result = await db.execute(count_stmt)
-        
-        categories = result.scalars().all()
-        total = count_result.scalar()
-        
+        if cursor is not None:
+            cursor_created_at = bindparam("cursor_created_at", cursor[0])
+            cursor_id = bindparam("cursor_id", cursor[1])
+            stmt += lambda s: s.where(
+                tuple_(Category.created_at, Category.id) < tuple_(cursor_created_at, cursor_id)
+            )
+        else:
+            stmt += lambda s: s.offset(skip)
+        stmt += lambda s: s.limit(limit).order_by(Category.created_at.desc(), Category.id.desc())
+
+        # Execute: one round-trip in every mode
+        if cursor is None and cached_total is None:
+            rows = (await db.execute(stmt)).all()
+            categories = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total
+            else:
+                # Page landed past the last row: the window column vanished
+                # with the rows, so issue the real count rather than caching
+                # a false zero
+                count_stmt = select(func.count()).select_from(Category)
+                if is_active is not None:
+                    count_stmt = count_stmt.where(Category.is_active == is_active)
+                total = await db.scalar(count_stmt)
+            self._store_total(cache_key, total)
+        else:
+            categories = (await db.execute(stmt)).scalars().all()
+            total = cached_total
+
         return categories, total
     
     async def update(
@@ -72,39 +135,93 @@ class CategoryCRUD:
         db_obj: Category, 
         obj_in: CategoryUpdate
     ) -> Category:
-        """Update category"""
+        """Update category in one UPDATE..RETURNING round-trip"""
         update_data = obj_in.model_dump(exclude_unset=True)
-        
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
-        
-        db_obj.updated_at = datetime.now(UTC)
+        if not update_data:
+            return db_obj
+
+        stmt = (
+            update(Category)
+            .where(Category.id == db_obj.id)
+            .values(**update_data)
+            .returning(Category)
+        )
+        category = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(db_obj)
-        return db_obj
+        self._invalidate_counts()
+        return category
     
     async def delete(self, db: AsyncSession, *, id: int) -> bool:
-        """Delete category"""
-        stmt = select(Category).where(Category.id == id)
-        result = await db.execute(stmt)
-        category = result.scalar_one_or_none()
-        
-        if category:
-            await db.delete(category)
-            await db.commit()
+        """Delete category in a single DELETE..RETURNING round-trip"""
+        stmt = delete(Category).where(Category.id == id).returning(Category.id)
+        deleted_id = (await db.execute(stmt)).scalar_one_or_none()
+        await db.commit()
+        if deleted_id is not None:
+            self._invalidate_counts()
             return True
         return False
-    
+
     async def soft_delete(self, db: AsyncSession, *, id: int) -> Optional[Category]:
-        """Soft delete category (set is_active to False)"""
-        category = await self.get(db, id=id)
-        if category:
-            category.is_active = False
-            category.updated_at = datetime.now(UTC)
-            await db.commit()
-            await db.refresh(category)
+        """Soft delete category (set is_active to False) in one UPDATE..RETURNING"""
+        stmt = (
+            update(Category)
+            .where(Category.id == id)
+            .values(is_active=False)
+            .returning(Category)
+        )
+        category = (await db.execute(stmt)).scalar_one_or_none()
+        await db.commit()
+        if category is not None:
+            self._invalidate_counts()
         return category
 
 
+class CategoryExistsLoader:
+    """Request-scoped loader that batches active-category existence checks
+
+    Concurrent `load()` calls within one event-loop tick are coalesced into a
+    single `WHERE id IN (...)` query, and results are memoized for the rest of
+    the request, so repeated checks for the same category cost nothing.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+        self._cache: dict[int, bool] = {}
+        self._pending: dict[int, asyncio.Future] = {}
+        self._dispatch_scheduled = False
+
+    async def load(self, category_id: int) -> bool:
+        """Check that the category exists and is active"""
+        if category_id in self._cache:
+            return self._cache[category_id]
+        if category_id in self._pending:
+            return await self._pending[category_id]
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[category_id] = future
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop = asyncio.get_running_loop()
+            loop.call_soon(lambda: asyncio.ensure_future(self._dispatch()))
+        return await future
+
+    async def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._dispatch_scheduled = False
+        try:
+            stmt = select(Category.id).where(Category.id.in_(pending), Category.is_active == True)
+            found = set((await self._db.scalars(stmt)).all())
+        except Exception as exc:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for category_id, future in pending.items():
+            exists = category_id in found
+            self._cache[category_id] = exists
+            future.set_result(exists)
+
+
 # Create instance
 category_crud = CategoryCRUD()
\ No newline at end of file
@@ -1,7 +1,20 @@
 from fastcrud import FastCRUD
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.user import User
 from ..schemas.user import UserCreateInternal, UserDelete, UserRead, UserUpdate, UserUpdateInternal
 
-CRUDUser = FastCRUD[User, UserCreateInternal, UserUpdate, UserUpdateInternal, UserDelete, UserRead]
+
+class CRUDUser(FastCRUD[User, UserCreateInternal, UserUpdate, UserUpdateInternal, UserDelete, UserRead]):
+    async def get_by_identifier(self, db: AsyncSession, identifier: str) -> User | None:
+        """Fetch a user by username or email in one query; Postgres resolves it with a BitmapOr over both unique indexes"""
+        stmt = (
+            select(User)
+            .where(or_(User.username == identifier, User.email == identifier), User.is_deleted.is_(False))
+            .limit(1)
+        )
+        return await db.scalar(stmt)
+
+
 crud_users = CRUDUser(User)
@@ -1,10 +1,9 @@
 import uuid as uuid_pkg
-from datetime import UTC, datetime
+from datetime import datetime
 
-from sqlalchemy import ForeignKey, String, Text, DateTime
+from sqlalchemy import ForeignKey, Index, String, Text, DateTime, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from uuid6 import uuid7
 
 from ..core.db.database import Base
 
@@ -26,8 +25,31 @@ class Article(Base):
     category: Mapped["Category"] = relationship("Category", back_populates="articles", init=False)
     author: Mapped["User"] = relationship("User", back_populates="articles", init=False)
     
-    uuid: Mapped[uuid_pkg.UUID] = mapped_column(UUID(as_uuid=True), default_factory=uuid7, unique=True, init=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default_factory=lambda: datetime.now(UTC), init=False)
-    updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None, init=False)
+    uuid: Mapped[uuid_pkg.UUID] = mapped_column(UUID(as_uuid=True), server_default=func.uuid_generate_v7(), unique=True, init=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), init=False)
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None, onupdate=func.now(), init=False)
     is_published: Mapped[bool] = mapped_column(default=False, index=True)
-    is_active: Mapped[bool] = mapped_column(default=True)
\ No newline at end of file
+    is_active: Mapped[bool] = mapped_column(default=True)
+
+
+# Composite index matching the keyset pagination order in get_multi
+Index("ix_article_created_at_desc_id_desc", Article.created_at.desc(), Article.id.desc())
+
+# Partial composite indexes for the common "visible articles in X" listings:
+# filter on category/author plus the published+active predicate, ordered the
+# same way get_multi sorts. The single-column indexes stay — the partial ones
+# only cover published+active rows, and get_multi accepts any filter combination
+Index(
+    "ix_article_cat_created",
+    Article.category_id,
+    Article.created_at.desc(),
+    Article.id.desc(),
+    postgresql_where=text("is_published AND is_active"),
+)
+Index(
+    "ix_article_author_created",
+    Article.author_id,
+    Article.created_at.desc(),
+    Article.id.desc(),
+    postgresql_where=text("is_published AND is_active"),
+)
\ No newline at end of file
@@ -1,6 +1,6 @@
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from datetime import datetime, UTC
-from sqlalchemy import String, DateTime, Boolean, Integer
+from sqlalchemy import String, DateTime, Boolean, Integer, func
 from typing import Optional
 
 
@@ -15,16 +15,15 @@ class TimestampMixin:
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.now(UTC),
+        server_default=func.now(),
         nullable=False,
         index=True,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.now(UTC),
-        onupdate=datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
-        index=True,
     )
 
 
@@ -37,11 +36,9 @@ class SoftDeleteMixin:
         index=True,
     )
 
-    deleted_at: Mapped[Optional[datetime]] = (
-        mapped_column(
-            DateTime(timezone=True),
-            nullable=True,
-        ),
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
     )
 
 
@@ -53,6 +50,5 @@ class BaseCustomModel(Base, TimestampMixin, SoftDeleteMixin):
     id: Mapped[int] = mapped_column(
         Integer,
         primary_key=True,
-        index=True,
         autoincrement=True,
     )
@@ -1,11 +1,11 @@
 from ...core.db.database import Base
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, ForeignKey, UUID
-from uuid6 import uuid7
+from sqlalchemy import String, ForeignKey, UUID, event
+from sqlalchemy.orm import Session, with_loader_criteria
 import uuid as uuid_pkg
 from sqlalchemy.orm import Mapped, mapped_column
-from datetime import datetime, UTC
-from sqlalchemy import String, DateTime, Boolean, Integer
+from datetime import datetime
+from sqlalchemy import String, DateTime, Boolean, Index, Integer, func, text
 from typing import Optional
 
 
@@ -14,7 +14,6 @@ class Blog(Base):
     id: Mapped[int] = mapped_column(
         Integer,
         primary_key=True,
-        index=True,
         autoincrement=True,
         init=False,
     )
@@ -22,6 +21,7 @@ class Blog(Base):
     title: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
+        unique=True,
     )
 
     content: Mapped[str] = mapped_column(
@@ -36,24 +36,22 @@ class Blog(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.now(UTC),
+        server_default=func.now(),
         nullable=False,
         index=True,
         init=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.now(UTC),
-        onupdate=datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
-        index=True,
         init=False,
     )
 
     is_deleted: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
-        index=True,
         init=False,
     )
 
@@ -67,7 +65,36 @@ class Blog(Base):
     # Fields with defaults last - using init=False to avoid dataclass issues
     uuid: Mapped[uuid_pkg.UUID] = mapped_column(
         UUID(as_uuid=True),
-        default_factory=uuid7,
+        server_default=func.uuid_generate_v7(),
         unique=True,
         init=False,
     )
+
+
+# Partial index matching how blogs are actually listed: live rows only,
+# ordered by the (created_at, id) keyset
+Index(
+    "ix_blogs_active_created_at_id",
+    Blog.created_at,
+    Blog.id,
+    postgresql_where=text("NOT is_deleted"),
+)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _filter_deleted_blogs(execute_state) -> None:
+    """Hide soft-deleted blogs from every ORM SELECT automatically
+
+    One registration replaces the per-query `is_deleted != True` fragments,
+    so the predicate cannot be forgotten and the compiled statement stays
+    cacheable. Pass `execution_options(include_deleted=True)` to opt out.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(Blog, lambda cls: cls.is_deleted == False, include_aliases=True)
+        )
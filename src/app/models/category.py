@@ -1,10 +1,9 @@
 import uuid as uuid_pkg
-from datetime import UTC, datetime
+from datetime import datetime
 
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from uuid6 import uuid7
 
 from ..core.db.database import Base
 
@@ -18,9 +17,9 @@ class Category(Base):
     description: Mapped[str | None] = mapped_column(String(500), default=None)
     
     # Relationships
-    articles: Mapped[list["Article"]] = relationship("Article", back_populates="category", init=False)
+    articles: Mapped[list["Article"]] = relationship("Article", back_populates="category", lazy="raise_on_sql", init=False)
     
-    uuid: Mapped[uuid_pkg.UUID] = mapped_column(UUID(as_uuid=True), default_factory=uuid7, unique=True, init=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default_factory=lambda: datetime.now(UTC), init=False)
-    updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None, init=False)
+    uuid: Mapped[uuid_pkg.UUID] = mapped_column(UUID(as_uuid=True), server_default=func.uuid_generate_v7(), unique=True, init=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), init=False)
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None, onupdate=func.now(), init=False)
     is_active: Mapped[bool] = mapped_column(default=True)
\ No newline at end of file
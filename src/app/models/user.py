@@ -32,4 +32,4 @@ class User(Base):
     tier_id: Mapped[int | None] = mapped_column(ForeignKey("tier.id"), index=True, default=None, init=False)
     
     # Relationships
-    articles: Mapped[list["Article"]] = relationship("Article", back_populates="author", init=False)
+    articles: Mapped[list["Article"]] = relationship("Article", back_populates="author", lazy="raise_on_sql", init=False)
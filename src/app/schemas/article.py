@@ -33,10 +33,16 @@ class ArticleUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-# Schema for response without relationships
-class ArticleResponseSimple(ArticleBase):
+# Schema for response without relationships and without the heavy content
+# body, so list queries can project only these columns
+class ArticleResponseSimple(BaseModel):
     id: int
+    title: str
+    summary: Optional[str] = None
+    category_id: int
     author_id: int
+    is_published: bool
+    is_active: bool
     uuid: uuid.UUID
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -44,9 +50,30 @@ class ArticleResponseSimple(ArticleBase):
     class Config:
         from_attributes = True
 
-
-# Schema for response with relationships
-class ArticleResponse(ArticleResponseSimple):
+    @classmethod
+    def from_orm_fast(cls, obj) -> "ArticleResponseSimple":
+        """Build from an Article row without re-validating — DB data is already typed"""
+        return cls.model_construct(
+            id=obj.id,
+            title=obj.title,
+            summary=obj.summary,
+            category_id=obj.category_id,
+            author_id=obj.author_id,
+            is_published=obj.is_published,
+            is_active=obj.is_active,
+            uuid=obj.uuid,
+            created_at=obj.created_at,
+            updated_at=obj.updated_at,
+        )
+
+
+# Schema for single-item response: full content, no relationships
+class ArticleResponseDetail(ArticleResponseSimple):
+    content: str
+
+
+# Schema for response with relationships and full content
+class ArticleResponse(ArticleResponseDetail):
     category: CategoryResponse
     author: UserResponse
 
@@ -55,18 +82,22 @@ class ArticleResponse(ArticleResponseSimple):
 
 
 # Schema for list response with pagination
+# total/page/pages are only populated for page-number pagination;
+# cursor pagination fills next_cursor instead
 class ArticleListResponse(BaseModel):
     articles: list[ArticleResponseSimple]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 # Schema for detailed list response with relationships
 class ArticleDetailListResponse(BaseModel):
     articles: list[ArticleResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     size: int
-    pages: int
\ No newline at end of file
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -29,7 +29,8 @@ class Blog(FullAuditSchema, BlogBase, UUIDSchema):
 
 
 class BlogRead(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    # frozen: response models are never mutated, so skip __setattr__ dispatch
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
     title: Annotated[
@@ -54,12 +55,52 @@ class BlogRead(BaseModel):
     deleted_at: Optional[datetime]
     is_deleted: bool
 
+    @classmethod
+    def from_orm_fast(cls, obj) -> "BlogRead":
+        """Build from a Blog row without re-validating — DB data is already typed"""
+        return cls.model_construct(
+            id=obj.id,
+            title=obj.title,
+            content=obj.content,
+            created_by_user_id=obj.created_by_user_id,
+            created_at=obj.created_at,
+            updated_at=obj.updated_at,
+            deleted_at=obj.deleted_at,
+            is_deleted=obj.is_deleted,
+        )
+
+
+class BlogSummaryRead(BaseModel):
+    """List-view projection without the content body (up to 50k chars per row)"""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int
+    title: str
+    created_by_user_id: int
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_orm_fast(cls, obj) -> "BlogSummaryRead":
+        """Build from a Blog row without re-validating — DB data is already typed"""
+        return cls.model_construct(
+            id=obj.id,
+            title=obj.title,
+            created_by_user_id=obj.created_by_user_id,
+            created_at=obj.created_at,
+            updated_at=obj.updated_at,
+        )
+
 
 class BlogCreate(BlogBase):
     model_config = ConfigDict(extra="forbid")
 
 
 class BlogCreateInternal(BlogCreate):
+    # Internal-only schema; build its core schema lazily on first use
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     created_by_user_id: int
 
 
@@ -84,18 +125,24 @@ class BlogUpdate(BaseModel):
 
 
 class BlogUpdateInternal(BlogUpdate):
+    # Internal-only schema; build its core schema lazily on first use
+    model_config = ConfigDict(defer_build=True)
+
     updated_at: datetime
 
 
 class BlogDelete(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     is_deleted: bool
     deleted_at: datetime
 
 class BlogListResponse(BaseModel):
-    data: list[BlogRead]
-    total: int
-    page: int
+    # total/page/pages are only populated for page-number pagination;
+    # cursor pagination fills next_cursor instead
+    data: list[BlogSummaryRead]
+    total: Optional[int] = None
+    page: Optional[int] = None
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
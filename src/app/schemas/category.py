@@ -34,11 +34,27 @@ class CategoryResponse(CategoryBase):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, obj) -> "CategoryResponse":
+        """Build from a Category row without re-validating — DB data is already typed"""
+        return cls.model_construct(
+            name=obj.name,
+            description=obj.description,
+            is_active=obj.is_active,
+            id=obj.id,
+            uuid=obj.uuid,
+            created_at=obj.created_at,
+            updated_at=obj.updated_at,
+        )
+
 
 # Schema for list response with pagination
+# total/page/pages are only populated for page-number pagination;
+# cursor pagination fills next_cursor instead
 class CategoryListResponse(BaseModel):
     categories: list[CategoryResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     size: int
-    pages: int
\ No newline at end of file
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -6,8 +6,10 @@ from typing import Annotated, Optional, Any
 from fastapi import Depends
 from ...core.auth import get_current_active_user
 from ...models.user import User
-from sqlalchemy import select, func
-from datetime import UTC, datetime
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.orm import load_only
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from datetime import datetime
 
 
 class BlogService:
@@ -19,79 +21,133 @@ class BlogService:
         db: AsyncSession,
         input: BlogCreate,
         current_user: User,
-    ) -> dict[str, Any]:
-        """Create Blog"""
-        blog = Blog(
-            content=input.content,
-            title=input.title,
-            created_by_user_id=current_user["id"],
+    ) -> Optional[Blog]:
+        """Create Blog in one INSERT; returns None when the title already exists"""
+        stmt = (
+            pg_insert(Blog)
+            .values(
+                content=input.content,
+                title=input.title,
+                created_by_user_id=current_user.id,
+            )
+            .on_conflict_do_nothing(index_elements=["title"])
+            .returning(Blog)
         )
-        db.add(blog)
+        blog = (await db.execute(stmt)).scalar_one_or_none()
         await db.commit()
-        await db.refresh(blog)
         return blog
 
-    async def get_by_name(self, db: AsyncSession, title: str) -> Optional[Blog]:
-        """Get category by name"""
-        stmt = select(Blog).where(Blog.title == title)
-        result = await db.execute(stmt)
-        return result.scalar_one_or_none()
-
     async def get(self, db: AsyncSession, id: int) -> Optional[Blog]:
         """Get Blog by id"""
-        query = select(Blog).where(Blog.id == id and Blog.is_deleted != True)
+        query = select(Blog).where(Blog.id == id)
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_updated_at(self, db: AsyncSession, id: int) -> Optional[datetime]:
+        """Get only the blog's last-modified time — a cheap probe for conditional GETs"""
+        query = select(func.coalesce(Blog.updated_at, Blog.created_at)).where(Blog.id == id)
+        return await db.scalar(query)
+
     async def get_multi_blog(
         self,
         db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[Blog], int]:
-        """Get Multi Blogs with pagination"""
-        query = select(Blog).where(Blog.is_deleted != True)
-        count_query = select(func.count(Blog.id)).where(Blog.is_deleted != True)
+        cursor: Optional[tuple[datetime, int]] = None,
+    ) -> tuple[list[Blog], Optional[int]]:
+        """Get Multi Blogs with pagination
 
-        query = query.offset(skip).limit(limit).order_by(Blog.created_at)
-
-        result = await db.execute(query)
-        count_result = await db.execute(count_query)
+        With a keyset `cursor` the page starts after the given (created_at, id)
+        position instead of using OFFSET, and no COUNT query is issued.
+        """
+        # Soft-deleted rows are filtered globally by the do_orm_execute
+        # listener registered next to the Blog model. Page mode projects the
+        # total as a window column so one round-trip covers rows and count.
+        # Only the BlogSummaryRead columns are loaded — the content body can
+        # be 50k chars and list views never show it
+        projection = load_only(
+            Blog.id,
+            Blog.title,
+            Blog.created_by_user_id,
+            Blog.created_at,
+            Blog.updated_at,
+        )
+        if cursor is None:
+            query = select(Blog, func.count().over().label("total")).options(projection).offset(skip)
+        else:
+            query = (
+                select(Blog)
+                .options(projection)
+                .where(tuple_(Blog.created_at, Blog.id) > cursor)
+            )
+        query = query.limit(limit).order_by(Blog.created_at, Blog.id)
 
-        blogs = result.scalars().all()
-        total = count_result.scalar()
+        if cursor is None:
+            rows = (await db.execute(query)).all()
+            blogs = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total
+            else:
+                # Page landed past the last row: the window column vanished
+                # with the rows, so issue the real count instead of reporting 0
+                total = await db.scalar(select(func.count(Blog.id)))
+        else:
+            blogs = (await db.execute(query)).scalars().all()
+            total = None
 
         return blogs, total
 
+    async def stream_blogs(
+        self,
+        db: AsyncSession,
+        cursor: Optional[tuple[datetime, int]] = None,
+    ):
+        """Stream blogs as a server-side cursor instead of one big fetchall
+
+        Rows arrive from the driver in yield_per-sized chunks, so a large
+        export never holds the whole result set in memory. An optional
+        keyset `cursor` resumes after the given (created_at, id) position.
+        """
+        stmt = select(Blog).order_by(Blog.created_at, Blog.id)
+        if cursor is not None:
+            stmt = stmt.where(tuple_(Blog.created_at, Blog.id) > cursor)
+        return await db.stream_scalars(stmt.execution_options(yield_per=100))
+
     async def update_blog(
         self,
         db: AsyncSession,
         data: Blog,
         input: BlogUpdate,
     ) -> Blog:
-        """Update Blog"""
+        """Update Blog in one UPDATE..RETURNING round-trip"""
         update_data = input.model_dump(exclude_unset=True)
+        if not update_data:
+            return data
 
-        for field, value in update_data.items():
-            setattr(data, field, value)
-
-        data.updated_at = datetime.now(UTC)
+        stmt = (
+            update(Blog)
+            .where(Blog.id == data.id)
+            .values(**update_data)
+            .returning(Blog)
+        )
+        blog = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(data)
-        return data
+        return blog
 
     async def delete_blog(
         self,
         db: AsyncSession,
         blog_id: int,
     ) -> Optional[Blog]:
-        """DELETE SOFT BLOG"""
-        blog = await self.get(db, blog_id)
-        if blog:
-            blog.is_deleted = True
-            blog.deleted_at = datetime.now(UTC)
-            await db.commit()
-            await db.refresh(blog)
+        """DELETE SOFT BLOG in one UPDATE..RETURNING round-trip"""
+        stmt = (
+            update(Blog)
+            .where(Blog.id == blog_id, Blog.is_deleted.is_(False))
+            .values(is_deleted=True, deleted_at=func.now())
+            .returning(Blog)
+        )
+        blog = (await db.execute(stmt)).scalar_one_or_none()
+        await db.commit()
         return blog
 
 
@@ -0,0 +1,37 @@
+"""article partial listing indexes
+
+Revision ID: 4f7c21d0a8be
+Revises: b3a56f0d219c
+Create Date: 2026-08-29 13:32:17.561204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '4f7c21d0a8be'
+down_revision: Union[str, None] = 'b3a56f0d219c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_article_cat_created',
+        'article',
+        ['category_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text('is_published AND is_active'),
+    )
+    op.create_index(
+        'ix_article_author_created',
+        'article',
+        ['author_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text('is_published AND is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_article_author_created', table_name='article')
+    op.drop_index('ix_article_cat_created', table_name='article')
@@ -0,0 +1,26 @@
+"""drop redundant blogs id index
+
+Revision ID: 7c0fb2e94a13
+Revises: d52e8a3b61cf
+Create Date: 2026-08-29 15:10:33.708214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7c0fb2e94a13'
+down_revision: Union[str, None] = 'd52e8a3b61cf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The primary key already provides a unique btree on id
+    op.drop_index(op.f('ix_blogs_id'), table_name='blogs')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_blogs_id'), 'blogs', ['id'], unique=False)
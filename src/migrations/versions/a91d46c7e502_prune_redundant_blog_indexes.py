@@ -0,0 +1,34 @@
+"""prune redundant blog indexes
+
+Revision ID: a91d46c7e502
+Revises: 4f7c21d0a8be
+Create Date: 2026-08-29 14:02:48.119366
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91d46c7e502'
+down_revision: Union[str, None] = '4f7c21d0a8be'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f('ix_blogs_updated_at'), table_name='blogs')
+    op.drop_index(op.f('ix_blogs_is_deleted'), table_name='blogs')
+    op.create_index(
+        'ix_blogs_active_created_at_id',
+        'blogs',
+        ['created_at', 'id'],
+        postgresql_where=sa.text('NOT is_deleted'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blogs_active_created_at_id', table_name='blogs')
+    op.create_index(op.f('ix_blogs_is_deleted'), 'blogs', ['is_deleted'], unique=False)
+    op.create_index(op.f('ix_blogs_updated_at'), 'blogs', ['updated_at'], unique=False)
@@ -0,0 +1,27 @@
+"""blog server side timestamp defaults
+
+Revision ID: b3a56f0d219c
+Revises: e88d1b43f6a0
+Create Date: 2026-08-29 13:05:41.332870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3a56f0d219c'
+down_revision: Union[str, None] = 'e88d1b43f6a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('blogs', 'created_at', server_default=sa.text('now()'))
+    op.alter_column('blogs', 'updated_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    op.alter_column('blogs', 'created_at', server_default=None)
+    op.alter_column('blogs', 'updated_at', server_default=None)
@@ -0,0 +1,27 @@
+"""server side timestamp defaults
+
+Revision ID: c41f09a2d7b8
+Revises: 9352db3fa635
+Create Date: 2026-08-29 10:12:05.118420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f09a2d7b8'
+down_revision: Union[str, None] = '9352db3fa635'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('article', 'created_at', server_default=sa.text('now()'))
+    op.alter_column('category', 'created_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    op.alter_column('article', 'created_at', server_default=None)
+    op.alter_column('category', 'created_at', server_default=None)
@@ -0,0 +1,55 @@
+"""server side uuid generation
+
+Revision ID: d52e8a3b61cf
+Revises: a91d46c7e502
+Create Date: 2026-08-29 14:21:09.482663
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd52e8a3b61cf'
+down_revision: Union[str, None] = 'a91d46c7e502'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# UUIDv7 built from gen_random_uuid(): overlay the first 48 bits with the
+# millisecond unix timestamp and force the version/variant bits, so no
+# extension (pg_uuidv7) is required.
+UUID_GENERATE_V7 = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+SELECT encode(
+    set_bit(
+        set_bit(
+            overlay(
+                uuid_send(gen_random_uuid())
+                placing substring(
+                    int8send(floor(extract(epoch from clock_timestamp()) * 1000)::bigint)
+                    from 3
+                )
+                from 1 for 6
+            ),
+            52, 1
+        ),
+        53, 1
+    ),
+    'hex')::uuid;
+$$ LANGUAGE sql VOLATILE;
+"""
+
+
+def upgrade() -> None:
+    op.execute(UUID_GENERATE_V7)
+    op.alter_column('article', 'uuid', server_default=sa.text('uuid_generate_v7()'))
+    op.alter_column('category', 'uuid', server_default=sa.text('uuid_generate_v7()'))
+    op.alter_column('blogs', 'uuid', server_default=sa.text('uuid_generate_v7()'))
+
+
+def downgrade() -> None:
+    op.alter_column('blogs', 'uuid', server_default=None)
+    op.alter_column('category', 'uuid', server_default=None)
+    op.alter_column('article', 'uuid', server_default=None)
+    op.execute('DROP FUNCTION IF EXISTS uuid_generate_v7()')
@@ -0,0 +1,29 @@
+"""article keyset pagination index
+
+Revision ID: e88d1b43f6a0
+Revises: c41f09a2d7b8
+Create Date: 2026-08-29 11:40:22.904517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e88d1b43f6a0'
+down_revision: Union[str, None] = 'c41f09a2d7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_article_created_at_desc_id_desc',
+        'article',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_article_created_at_desc_id_desc', table_name='article')
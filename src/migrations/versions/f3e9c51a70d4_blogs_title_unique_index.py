@@ -0,0 +1,47 @@
+"""blogs title unique index
+
+Revision ID: f3e9c51a70d4
+Revises: 7c0fb2e94a13
+Create Date: 2026-08-29 16:02:47.193528
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3e9c51a70d4'
+down_revision: Union[str, None] = '7c0fb2e94a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create's INSERT..ON CONFLICT (title) needs a unique index behind it.
+    # Tables provisioned by create_all already carry the model's UNIQUE
+    # constraint, so guard with a catalog check instead of failing on the
+    # duplicate index.
+    op.execute(
+        sa.text(
+            """
+            DO $$
+            BEGIN
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_constraint
+                    WHERE conrelid = 'blogs'::regclass AND contype = 'u'
+                      AND conkey = ARRAY[
+                          (SELECT attnum FROM pg_attribute
+                           WHERE attrelid = 'blogs'::regclass AND attname = 'title')
+                      ]
+                ) THEN
+                    CREATE UNIQUE INDEX IF NOT EXISTS ix_blogs_title ON blogs (title);
+                END IF;
+            END $$;
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DROP INDEX IF EXISTS ix_blogs_title"))
@@ -0,0 +1,167 @@
+"""Unit tests for article API endpoints."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException, Response
+
+from src.app.api.v1.articles import delete_article, get_article, get_articles, update_article
+from src.app.core.utils.etag import make_etag
+from src.app.schemas.article import ArticleUpdate
+
+
+@pytest.fixture
+def mock_cache_client():
+    """Mock Redis client behind the cache decorator."""
+    client = Mock()
+    client.get = AsyncMock(return_value=None)
+    client.set = AsyncMock(return_value=True)
+    client.expire = AsyncMock(return_value=True)
+    client.delete = AsyncMock(return_value=True)
+    client.scan = AsyncMock(return_value=(0, []))
+    return client
+
+
+class TestGetArticles:
+    """Test articles list endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, mock_db, mock_cache_client):
+        """Test that a malformed keyset cursor is rejected with 400."""
+        request = Mock(method="GET")
+
+        with patch("src.app.core.utils.cache.client", mock_cache_client):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_articles(
+                    request,
+                    db=mock_db,
+                    page=1,
+                    size=10,
+                    cursor="not-a-cursor",
+                    category_id=None,
+                    author_id=None,
+                    is_published=None,
+                    is_active=None,
+                )
+
+        assert exc_info.value.status_code == 400
+
+
+class TestGetArticle:
+    """Test single-article endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_not_found(self, mock_db):
+        """Test retrieval when the article doesn't exist."""
+        request = Mock()
+        request.headers = {}
+
+        with patch("src.app.api.v1.articles.article_crud") as mock_crud:
+            mock_crud.get_updated_at = AsyncMock(return_value=None)
+
+            with pytest.raises(HTTPException) as exc_info:
+                await get_article(request, Mock(), db=mock_db, article_id=1)
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_if_none_match_returns_304(self, mock_db):
+        """Test that a matching If-None-Match answers 304 without fetching the row."""
+        last_modified = datetime(2026, 1, 2, 3, 4, 5)
+        etag = make_etag(last_modified, 1)
+        request = Mock()
+        request.headers = {"if-none-match": etag}
+
+        with patch("src.app.api.v1.articles.article_crud") as mock_crud:
+            mock_crud.get_updated_at = AsyncMock(return_value=last_modified)
+            mock_crud.get = AsyncMock()
+
+            result = await get_article(request, Mock(), db=mock_db, article_id=1)
+
+        assert isinstance(result, Response)
+        assert result.status_code == 304
+        assert result.headers["ETag"] == etag
+        mock_crud.get.assert_not_called()
+
+
+class TestUpdateArticle:
+    """Test article update endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_update_not_found(self, mock_db, mock_cache_client):
+        """Test update of a missing article."""
+        request = Mock(method="PUT")
+        current_user = Mock(id=1, is_superuser=False)
+
+        with patch("src.app.core.utils.cache.client", mock_cache_client):
+            with patch("src.app.api.v1.articles.article_crud") as mock_crud:
+                mock_crud.update_by_id = AsyncMock(return_value=(None, "not_found"))
+
+                with pytest.raises(HTTPException) as exc_info:
+                    await update_article(
+                        request,
+                        db=mock_db,
+                        article_id=1,
+                        article_in=ArticleUpdate(title="New title"),
+                        current_user=current_user,
+                        category_loader=Mock(),
+                    )
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_update_forbidden(self, mock_db, mock_cache_client):
+        """Test update of an article owned by someone else."""
+        request = Mock(method="PUT")
+        current_user = Mock(id=1, is_superuser=False)
+
+        with patch("src.app.core.utils.cache.client", mock_cache_client):
+            with patch("src.app.api.v1.articles.article_crud") as mock_crud:
+                mock_crud.update_by_id = AsyncMock(return_value=(None, "forbidden"))
+
+                with pytest.raises(HTTPException) as exc_info:
+                    await update_article(
+                        request,
+                        db=mock_db,
+                        article_id=1,
+                        article_in=ArticleUpdate(title="New title"),
+                        current_user=current_user,
+                        category_loader=Mock(),
+                    )
+
+        assert exc_info.value.status_code == 403
+
+
+class TestDeleteArticle:
+    """Test article deletion endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_delete_not_found(self, mock_db, mock_cache_client):
+        """Test deletion of a missing article."""
+        request = Mock(method="DELETE")
+        current_user = Mock(id=1, is_superuser=False)
+
+        with patch("src.app.core.utils.cache.client", mock_cache_client):
+            with patch("src.app.api.v1.articles.article_crud") as mock_crud:
+                mock_crud.delete_if_owned = AsyncMock(return_value="not_found")
+
+                with pytest.raises(HTTPException) as exc_info:
+                    await delete_article(request, db=mock_db, article_id=1, current_user=current_user)
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_delete_forbidden(self, mock_db, mock_cache_client):
+        """Test deletion of an article owned by someone else."""
+        request = Mock(method="DELETE")
+        current_user = Mock(id=1, is_superuser=False)
+
+        with patch("src.app.core.utils.cache.client", mock_cache_client):
+            with patch("src.app.api.v1.articles.article_crud") as mock_crud:
+                mock_crud.delete_if_owned = AsyncMock(return_value="forbidden")
+
+                with pytest.raises(HTTPException) as exc_info:
+                    await delete_article(request, db=mock_db, article_id=1, current_user=current_user)
+
+        assert exc_info.value.status_code == 403
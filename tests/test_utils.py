@@ -0,0 +1,48 @@
+"""Unit tests for the pagination cursor codec and ETag helper."""
+
+from datetime import datetime
+
+from src.app.core.utils.etag import make_etag
+from src.app.core.utils.pagination import decode_cursor, encode_cursor
+
+
+class TestCursorCodec:
+    """Test keyset cursor encoding and decoding."""
+
+    def test_round_trip(self):
+        """Test that an encoded cursor decodes back to the same position."""
+        created_at = datetime(2026, 1, 2, 3, 4, 5, 123456)
+
+        assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+    def test_malformed_without_separator(self):
+        """Test that a cursor without the separator decodes to None."""
+        assert decode_cursor("garbage") is None
+
+    def test_malformed_timestamp(self):
+        """Test that a cursor with a non-ISO timestamp decodes to None."""
+        assert decode_cursor("not-a-date_42") is None
+
+    def test_malformed_id(self):
+        """Test that a cursor with a non-integer id decodes to None."""
+        assert decode_cursor("2026-01-02T03:04:05_abc") is None
+
+
+class TestMakeEtag:
+    """Test weak ETag construction."""
+
+    def test_weak_and_deterministic(self):
+        """Test that the ETag is weak and stable for the same inputs."""
+        last_modified = datetime(2026, 1, 2, 3, 4, 5)
+
+        etag = make_etag(last_modified, 7)
+
+        assert etag.startswith('W/"')
+        assert etag == make_etag(last_modified, 7)
+
+    def test_varies_with_inputs(self):
+        """Test that different rows and timestamps produce different ETags."""
+        last_modified = datetime(2026, 1, 2, 3, 4, 5)
+
+        assert make_etag(last_modified, 7) != make_etag(last_modified, 8)
+        assert make_etag(last_modified, 7) != make_etag(datetime(2026, 1, 2, 3, 4, 6), 7)